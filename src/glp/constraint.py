@@ -1,10 +1,14 @@
+import sys
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Dict
 
 from glp.enums import ConstraintSense
 
+# ``slots`` is only accepted by dataclass() from Python 3.10 onwards.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Constraint:
     """
     Represents a single algebraic constraint.
@@ -19,7 +23,10 @@ class Constraint:
 
     Notes:
         - This class does not evaluate expressions; it only carries structure.
-        - Validation in __post_init__ ensures type safety for 'sense' and 'rhs'.
+        - Instances are immutable; use dataclasses.replace() to derive a
+          modified constraint.
+        - Validation in __post_init__ ensures type safety for 'sense' and 'rhs';
+          'rhs' is coerced to float once at construction.
     """
 
     name: str
@@ -35,10 +42,20 @@ class Constraint:
         - 'sense' is a ConstraintSense instance.
         - 'rhs' is numeric (int or float).
 
+        These are pure type checks, so they only run in debug mode and are
+        stripped under ``python -O``. 'rhs' is then always stored as a float,
+        so a non-numeric 'rhs' still raises ValueError in optimized mode.
+
         Raises:
             ValueError: If 'sense' is not a ConstraintSense or 'rhs' is not numeric.
         """
-        if not isinstance(self.sense, ConstraintSense):
-            raise ValueError("sense must be ConstraintSense")
-        if not isinstance(self.rhs, (int, float)):
-            raise ValueError("rhs must be numeric")
+        if __debug__:
+            if not isinstance(self.sense, ConstraintSense):
+                raise ValueError("sense must be ConstraintSense")
+            if not isinstance(self.rhs, (int, float)):
+                raise ValueError("rhs must be numeric")
+        try:
+            # Frozen dataclass: bypass __setattr__ to store the coerced value.
+            object.__setattr__(self, "rhs", float(self.rhs))
+        except (TypeError, ValueError):
+            raise ValueError("rhs must be numeric") from None
@@ -5,10 +5,11 @@ This module provides the fundamental building blocks to formulate and solve
 Goal Linear Programming problems using PuLP, including:
 
 - Decision variable management
-- Variable grouping and group-level bounds
+- Variable grouping, group-level bounds and fixed in-group ratios
 - Goal definitions with deviation variables
 - Hard constraints
 - Weighted Goal Programming solver
+- Lexicographic (preemptive) Goal Programming solver
 
 This file is intentionally minimal and generic, forming the foundation
 for higher-level problem-specific models (e.g., diet optimization).
@@ -16,27 +17,93 @@ for higher-level problem-specific models (e.g., diet optimization).
 
 from __future__ import annotations
 
-import re
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import operator
+import sys
+from dataclasses import replace
+from functools import lru_cache
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pulp
 from pulp import LpVariable
 
 from glp.constraint import Constraint
-from glp.enums import ConstraintSense
+from glp.enums import ConstraintSense, GoalSense
 from glp.goal import Goal
 
+# The model's building blocks are defined once, in their own modules, and
+# re-exported here so ``from glp.core import ...`` gives the same objects.
+__all__ = ["GLPModel", "Goal", "Constraint", "GoalSense", "ConstraintSense"]
+
 # ============================================================================
 # UTILS
 # ============================================================================
 
 
+def _translate_code_point(cp: int) -> Union[int, str]:
+    """
+    Map a code point to itself if the regex class ``\\w`` would match it
+    (alphanumeric or ``"_"``), and to ``"_"`` otherwise.
+    """
+    c = chr(cp)
+    return cp if c.isalnum() or c == "_" else "_"
+
+
+class _SanitizeTable(Dict[int, Union[int, str]]):
+    """
+    ``str.translate`` table mapping non-word characters to ``"_"``.
+
+    Latin-1 is filled in up front; other code points are classified on
+    first use and cached.
+    """
+
+    def __missing__(self, cp: int) -> Union[int, str]:
+        mapped = self[cp] = _translate_code_point(cp)
+        return mapped
+
+
+_SANITIZE_TABLE = _SanitizeTable((cp, _translate_code_point(cp)) for cp in range(256))
+
+_LP_STATUS = pulp.LpStatus
+
+# Constraint senses supported by PuLP -> relational operator building them
+_SENSE_OPS = {
+    ConstraintSense.LE: operator.le,
+    ConstraintSense.GE: operator.ge,
+    ConstraintSense.EQ: operator.eq,
+}
+
+# Upper-cased category names (and short aliases) -> PuLP categories
+_CAT_MAP = {
+    "CONTINUOUS": pulp.LpContinuous,
+    "CONT": pulp.LpContinuous,
+    "INTEGER": pulp.LpInteger,
+    "INT": pulp.LpInteger,
+    "BINARY": pulp.LpBinary,
+    "BIN": pulp.LpBinary,
+}
+
+
+@lru_cache(maxsize=4096)
 def _sanitize_name(name: str) -> str:
     """
     Sanitize a user-provided name to make it safe for PuLP.
 
     Replaces non-alphanumeric characters with underscores and ensures
     the resulting name is valid for use as a PuLP variable or constraint.
+    Results are memoized, since the same names are sanitized repeatedly
+    when variables, goals and their deviation variables are created, and
+    interned so that equal names share one string object.
 
     Parameters
     ----------
@@ -53,11 +120,49 @@ def _sanitize_name(name: str) -> str:
     ValueError
         If the name cannot be sanitized into a valid identifier.
     """
-    s = re.sub(r"\W+", "_", name.strip())
-    s = re.sub(r"_+", "_", s)
+    s = name.strip()
+    # Fast path: plain ASCII identifiers without "__" runs are already safe
+    # and would come back unchanged from the rewriting below.
+    if s.isascii() and s.isidentifier() and "__" not in s:
+        return sys.intern(s)
+    s = s.translate(_SANITIZE_TABLE)
+    while "__" in s:
+        s = s.replace("__", "_")
     if not s:
         raise ValueError("Invalid name after sanitization")
-    return s
+    return sys.intern(s)
+
+
+def _constraint_rows(problem: pulp.LpProblem) -> Dict[str, pulp.LpConstraint]:
+    """
+    Return the name -> constraint dict of a PuLP problem.
+
+    PuLP 3 keeps it in ``_constraints`` and turns ``constraints`` into a
+    deprecated (warning) view; older releases expose the dict directly.
+    """
+    rows = getattr(problem, "_constraints", None)
+    if rows is None:
+        rows = problem.constraints
+    return cast(Dict[str, pulp.LpConstraint], rows)
+
+
+def _default_solver() -> pulp.LpSolver:
+    """
+    Return the solver used when none is passed to a solve method.
+
+    HiGHS is preferred: PuLP drives it in-process through ``highspy``, which
+    avoids the subprocess start-up and LP/solution file round-trip of CBC.
+    CBC (bundled with PuLP) is used when HiGHS is not installed.
+
+    Returns
+    -------
+    pulp.LpSolver
+        A quiet (``msg=False``) solver instance.
+    """
+    highs = pulp.HiGHS(msg=False)
+    if highs.available():
+        return highs
+    return pulp.PULP_CBC_CMD(msg=False)
 
 
 # ============================================================================
@@ -74,14 +179,30 @@ class GLPModel:
     - Add decision variables (individually or in groups)
     - Organize variables into named groups
     - Apply collective lower/upper bounds to groups of variables
+    - Fix the relative proportions of variables within a group
     - Define goals with deviation variables (under- and over-achievement)
     - Add hard constraints
-    - Solve the model using Weighted Goal Programming
+    - Solve the model using Weighted or Lexicographic Goal Programming
 
     The design is intentionally generic and problem-agnostic, allowing
     this core model to be reused across diverse optimization problems.
     """
 
+    __slots__ = (
+        "name",
+        "_problem",
+        "_sense",
+        "variables",
+        "goals",
+        "constraints",
+        "dev_vars",
+        "variable_groups",
+        "_goal_links",
+        "_dev_weights",
+        "_pending_constraints",
+        "_bound_rows",
+    )
+
     def __init__(self, name: str = "glp", minimize: bool = True):
         """
         Initialize a GLP model.
@@ -94,9 +215,10 @@ class GLPModel:
             Whether the objective should be minimized (default True).
         """
         self.name = name
-        self.problem = pulp.LpProblem(
-            name, pulp.LpMinimize if minimize else pulp.LpMaximize
-        )
+
+        # The PuLP problem is created on first use (see ``problem``).
+        self._problem: Optional[pulp.LpProblem] = None
+        self._sense: int = pulp.LpMinimize if minimize else pulp.LpMaximize
 
         self.variables: Dict[str, pulp.LpVariable] = {}
         self.goals: Dict[str, Goal] = {}
@@ -104,6 +226,127 @@ class GLPModel:
         self.dev_vars: Dict[str, Tuple[pulp.LpVariable, pulp.LpVariable]] = {}
         self.variable_groups: Dict[str, List[str]] = {}
 
+        # Per-goal linking constraints and the default deviation weights,
+        # kept so repeated solves can reuse them instead of rebuilding.
+        self._goal_links: Dict[str, pulp.LpConstraint] = {}
+        self._dev_weights: Dict[pulp.LpVariable, float] = {}
+
+        # Rows added before the PuLP problem exists, inserted by flush().
+        self._pending_constraints: Dict[str, pulp.LpConstraint] = {}
+
+        # Names of the group-bound rows, which add_group_bounds may replace.
+        self._bound_rows: Set[str] = set()
+
+    # ----------------------------------------------------------------------
+    # PULP PROBLEM
+    # ----------------------------------------------------------------------
+    @property
+    def problem(self) -> pulp.LpProblem:
+        """
+        The underlying PuLP problem.
+
+        The problem is only created on first access, so a model can be
+        configured completely (including :attr:`minimize`) before PuLP
+        sees any of it. From then on, rows added through the model are
+        inserted immediately, so a held reference to the problem stays
+        up to date.
+        """
+        return self.flush()
+
+    @problem.setter
+    def problem(self, value: pulp.LpProblem) -> None:
+        # Needed for in-place updates such as ``model.problem += row, name``.
+        self._problem = value
+        self._sense = value.sense
+        self.flush()
+
+    @property
+    def minimize(self) -> bool:
+        """
+        Whether the objective is minimized. Can be changed at any time.
+        """
+        return bool(self._sense == pulp.LpMinimize)
+
+    @minimize.setter
+    def minimize(self, value: bool) -> None:
+        self._sense = pulp.LpMinimize if value else pulp.LpMaximize
+        if self._problem is not None:
+            self._problem.sense = self._sense
+
+    def flush(self) -> pulp.LpProblem:
+        """
+        Create the PuLP problem if needed and insert any queued rows.
+
+        Rows added before the problem exists are queued and inserted here
+        in one bulk update rather than one ``addConstraint`` call each.
+        Accessing :attr:`problem` (and therefore solving) flushes
+        automatically, so calling this directly is rarely needed.
+
+        Returns
+        -------
+        pulp.LpProblem
+            The up-to-date PuLP problem.
+        """
+
+        problem = self._problem
+        if problem is None:
+            problem = self._problem = pulp.LpProblem(self.name, self._sense)
+
+        if self._pending_constraints:
+            pending, self._pending_constraints = self._pending_constraints, {}
+            problem.extend(pending)
+            problem.modifiedConstraints.extend(pending.values())
+
+        return problem
+
+    def _insert_constraints(
+        self,
+        rows: Iterable[Tuple[str, pulp.LpConstraint]],
+        replace: AbstractSet[str] = frozenset(),
+    ) -> None:
+        """
+        Add named PuLP rows to the problem in one bulk update.
+
+        Rows are queued until the problem is created (see :attr:`problem`)
+        and inserted straight away after that. Names listed in ``replace``
+        may overwrite an existing row of the same name.
+
+        Raises
+        ------
+        TypeError
+            If a row is not a ``pulp.LpConstraint``, e.g. because a
+            comparison of plain numbers evaluated to a bool.
+        pulp.PulpError
+            If a row name is already used in the model or is repeated in
+            ``rows``.
+
+        Nothing is added if an error is raised.
+        """
+
+        rows = list(rows)
+        problem = self._problem
+        if problem is None:
+            existing = self._pending_constraints
+        else:
+            existing = _constraint_rows(problem)
+
+        seen = set()
+        for name, constr in rows:
+            if not isinstance(constr, pulp.LpConstraint):
+                raise TypeError(f"constraint '{name}' is not a linear constraint")
+            if name in seen or (name in existing and name not in replace):
+                raise pulp.PulpError(f"overlapping constraint names: {name}")
+            seen.add(name)
+
+        for name, constr in rows:
+            constr.name = name
+
+        if problem is None:
+            self._pending_constraints.update(rows)
+        else:
+            problem.extend(dict(rows))
+            problem.modifiedConstraints.extend(constr for _, constr in rows)
+
     # ----------------------------------------------------------------------
     # VARIABLE API
     # ----------------------------------------------------------------------
@@ -129,7 +372,8 @@ class GLPModel:
         up_bound : float, optional
             Upper bound for the variable (default is None).
         cat : str, optional
-            Variable category: "Continuous", "Integer", or "Binary".
+            Variable category: "Continuous", "Integer", or "Binary"
+            (case-insensitive; "Cont", "Int" and "Bin" are also accepted).
 
         Returns
         -------
@@ -137,17 +381,13 @@ class GLPModel:
             The created (or existing) PuLP variable.
         """
 
-        if name in self.variables:
-            return self.variables[name]
+        existing = self.variables.get(name)
+        if existing is not None:
+            return existing
 
         safe = _sanitize_name(name)
 
-        cat_map = {
-            "CONTINUOUS": pulp.LpContinuous,
-            "INTEGER": pulp.LpInteger,
-            "BINARY": pulp.LpBinary,
-        }
-        pulp_cat = cat_map.get(cat.upper(), pulp.LpContinuous)
+        pulp_cat = _CAT_MAP.get(cat.upper(), pulp.LpContinuous)
 
         var = pulp.LpVariable(safe, lowBound=low_bound, upBound=up_bound, cat=pulp_cat)
         self.variables[name] = var
@@ -227,14 +467,15 @@ class GLPModel:
             If any variable does not exist in the model.
         """
 
-        if group not in self.variable_groups:
-            self.variable_groups[group] = []
+        members = self.variable_groups.setdefault(group, [])
+        seen = set(members)
 
         for var in variables:
             if var not in self.variables:
                 raise KeyError(f"Variable '{var}' not found in model")
-            if var not in self.variable_groups[group]:
-                self.variable_groups[group].append(var)
+            if var not in seen:
+                seen.add(var)
+                members.append(var)
 
     # ----------------------------------------------------------------------
     # GROUP BOUNDING
@@ -252,6 +493,9 @@ class GLPModel:
             sum(group_variables) >= lower
             sum(group_variables) <= upper
 
+        Calling this again for the same group replaces the bounds given.
+        The rows are named ``{group}_LL`` and ``{group}_UL`` (sanitized).
+
         Parameters
         ----------
         group : str
@@ -265,19 +509,86 @@ class GLPModel:
         ------
         KeyError
             If the specified group does not exist.
+        pulp.PulpError
+            If another row of the model already uses a bound's name.
         """
 
-        if group not in self.variable_groups:
+        members = self.variable_groups.get(group)
+        if members is None:
             raise KeyError(f"Group '{group}' not defined")
 
-        vars_in_group = [self.variables[v] for v in self.variable_groups[group]]
+        vars_in_group = [self.variables[v] for v in members]
         total = pulp.lpSum(vars_in_group)
 
+        bounds = {}
         if lower is not None:
-            self.problem += total >= lower, f"{group}_LL"
-
+            bounds[_sanitize_name(f"{group}_LL")] = total >= lower
         if upper is not None:
-            self.problem += total <= upper, f"{group}_UL"
+            bounds[_sanitize_name(f"{group}_UL")] = total <= upper
+
+        # Bounds from an earlier call are replaced; any other row with the
+        # same name is an error.
+        self._insert_constraints(bounds.items(), replace=self._bound_rows)
+        self._bound_rows.update(bounds)
+
+    # ----------------------------------------------------------------------
+    # GROUP RATIOS
+    # ----------------------------------------------------------------------
+    def add_group_ratios(self, group: str, shares: Dict[str, float]) -> None:
+        """
+        Fix the relative proportions of variables within a group.
+
+        For members x_1, ..., x_K with shares s_1, ..., s_K, every member
+        is tied to the first one through:
+            s_1 * x_k - s_k * x_1 = 0        (k = 2, ..., K)
+
+        Only K-1 equalities are created. Stating each member's share of the
+        group total (x_k = s_k / S * sum(x)) would add a K-th row that is
+        linearly dependent on the others.
+
+        Parameters
+        ----------
+        group : str
+            Name of the variable group.
+        shares : dict
+            Mapping from variable name to its (positive) relative share.
+            Shares need not sum to one; e.g. {"rice": 0.8, "wheat": 0.2}
+            is equivalent to {"rice": 4, "wheat": 1}.
+
+        Raises
+        ------
+        KeyError
+            If the group does not exist or a variable is not in the group.
+        ValueError
+            If any share is not positive.
+        """
+
+        group_vars = self.variable_groups.get(group)
+        if group_vars is None:
+            raise KeyError(f"Group '{group}' not defined")
+
+        members = set(group_vars)
+        for name, share in shares.items():
+            if name not in members:
+                raise KeyError(f"Variable '{name}' not in group '{group}'")
+            if share <= 0:
+                raise ValueError("group ratio shares must be positive")
+
+        names = list(shares)
+        if len(names) < 2:
+            return
+
+        anchor = names[0]
+        x_anchor = self.variables[anchor]
+        s_anchor = shares[anchor]
+
+        self._insert_constraints(
+            (
+                _sanitize_name(f"{group}_RATIO_{name}"),
+                s_anchor * self.variables[name] - shares[name] * x_anchor == 0,
+            )
+            for name in names[1:]
+        )
 
     # ----------------------------------------------------------------------
     # CONSTRAINT API
@@ -300,22 +611,55 @@ class GLPModel:
             If a constraint with the same name already exists.
         """
 
-        if c.name in self.constraints:
-            raise ValueError(f"constraint '{c.name}' exists")
+        self.add_constraints([c])
+
+    # ----------------------------------------------------------------------
+    # MULTI-CONSTRAINT API
+    # ----------------------------------------------------------------------
+    def add_constraints(self, constraints: Iterable[Constraint]) -> None:
+        """
+        Add multiple hard constraints at once.
+
+        All constraints are validated and translated to PuLP before any is
+        added, so a duplicate name or invalid sense leaves the model
+        unchanged.
 
-        safe = _sanitize_name(c.name)
+        Parameters
+        ----------
+        constraints : iterable of Constraint
+            Constraint objects to add.
 
-        if c.sense == ConstraintSense.LE:
-            constr = c.expression <= c.rhs
-        elif c.sense == ConstraintSense.GE:
-            constr = c.expression >= c.rhs
-        elif c.sense == ConstraintSense.EQ:
-            constr = c.expression == c.rhs
-        else:
+        Raises
+        ------
+        ValueError
+            If a constraint name already exists or is repeated in
+            ``constraints``, or a constraint sense is not supported.
+        pulp.PulpError
+            If two constraint names sanitize to the same PuLP row name.
+        """
+
+        constraints = list(constraints)
+
+        seen = set(self.constraints)
+        for c in constraints:
+            if c.name in seen:
+                raise ValueError(f"constraint '{c.name}' exists")
+            seen.add(c.name)
+
+        self._insert_constraints(self._build_constraint(c) for c in constraints)
+
+        self.constraints.update((c.name, c) for c in constraints)
+
+    def _build_constraint(self, c: Constraint) -> Tuple[str, pulp.LpConstraint]:
+        """
+        Translate a Constraint into its PuLP name and PuLP constraint.
+        """
+
+        op = _SENSE_OPS.get(c.sense)
+        if op is None:
             raise ValueError("invalid constraint sense")
 
-        self.problem.addConstraint(constr, name=safe)
-        self.constraints[c.name] = c
+        return _sanitize_name(c.name), op(c.expression, c.rhs)
 
     # ----------------------------------------------------------------------
     # GOAL API
@@ -353,24 +697,131 @@ class GLPModel:
             If a goal with the same name already exists.
         """
 
-        if g.name in self.goals:
-            raise ValueError(f"goal '{g.name}' exists")
+        return self.add_goals([g])[g.name]
+
+    # ----------------------------------------------------------------------
+    # MULTI-GOAL API
+    # ----------------------------------------------------------------------
+    def add_goals(
+        self, goals: Iterable[Goal]
+    ) -> Dict[str, Tuple[LpVariable, LpVariable]]:
+        """
+        Add multiple goals at once.
+
+        All goal names are checked, and all deviation variables and linking
+        constraints are built, before any goal is added, so a duplicate
+        name leaves the model unchanged.
+
+        Parameters
+        ----------
+        goals : iterable of Goal
+            Goal definitions to add.
+
+        Returns
+        -------
+        dict
+            Mapping from goal name to its (n, p) deviation variables.
+
+        Raises
+        ------
+        ValueError
+            If a goal name already exists or is repeated in ``goals``.
+        TypeError
+            If a goal expression is not a linear expression.
+        pulp.PulpError
+            If two goal names sanitize to the same PuLP row name.
+        """
+
+        goals = list(goals)
+
+        seen = set(self.goals)
+        for g in goals:
+            if g.name in seen:
+                raise ValueError(f"goal '{g.name}' exists")
+            seen.add(g.name)
+
+        built = [self._build_goal(g) for g in goals]
+
+        self._insert_constraints((linking.name, linking) for _, _, linking in built)
+
+        self.variables.update(
+            (var.name, var) for n_var, p_var, _ in built for var in (n_var, p_var)
+        )
+
+        created = {}
+        for g, (n_var, p_var, linking) in zip(goals, built):
+            self.goals[g.name] = g
+            self.dev_vars[g.name] = (n_var, p_var)
+            self._goal_links[g.name] = linking
+            self._dev_weights[n_var] = g.weight
+            self._dev_weights[p_var] = g.weight
+            created[g.name] = (n_var, p_var)
+
+        return created
+
+    def _build_goal(self, g: Goal) -> Tuple[LpVariable, LpVariable, pulp.LpConstraint]:
+        """
+        Create a goal's deviation variables and its named linking constraint.
+        """
 
         safe = _sanitize_name(g.name)
 
         n_var = pulp.LpVariable(f"n_{safe}", lowBound=0)
         p_var = pulp.LpVariable(f"p_{safe}", lowBound=0)
 
-        self.variables[f"n_{safe}"] = n_var
-        self.variables[f"p_{safe}"] = p_var
+        # Copy the goal expression once and add the deviations in place;
+        # ``expression + n - p`` would copy the full term dict twice.
+        # Let PuLP reject unsupported expressions rather than type-checking,
+        # except for constraints: the copy would silently drop their sense.
+        if isinstance(g.expression, pulp.LpConstraint):
+            raise TypeError("Goal.expression must support linear arithmetic")
+        try:
+            lhs = pulp.LpAffineExpression(g.expression)
+        except (TypeError, ValueError) as e:
+            raise TypeError("Goal.expression must support linear arithmetic") from e
+        lhs.addterm(n_var, 1.0)
+        lhs.addterm(p_var, -1.0)
+        linking = pulp.LpConstraint(
+            e=lhs,
+            sense=pulp.LpConstraintEQ,
+            rhs=g.target,
+            name=f"goal_link_{safe}",
+        )
+
+        return n_var, p_var, linking
+
+    # ----------------------------------------------------------------------
+    # GOAL TARGET UPDATES
+    # ----------------------------------------------------------------------
+    def set_goal_target(self, name: str, target: float) -> None:
+        """
+        Change the target of an existing goal.
+
+        Only the right-hand side of the goal's linking constraint is
+        updated; no expressions are rebuilt. This keeps scenario sweeps
+        over targets cheap between successive solves.
+
+        Parameters
+        ----------
+        name : str
+            Name of the goal.
+        target : float
+            New target value.
 
-        linking = g.expression + n_var - p_var == float(g.target)
-        self.problem.addConstraint(linking, name=f"goal_link_{safe}")
+        Raises
+        ------
+        KeyError
+            If the goal does not exist.
+        """
 
-        self.goals[g.name] = g
-        self.dev_vars[g.name] = (n_var, p_var)
+        g = self.goals[name]
+        linking = self._goal_links[name]
+        updated = replace(g, target=target)
 
-        return n_var, p_var
+        # The constraint constant also carries any constant term of the goal
+        # expression, so shift it by the change in target.
+        linking.changeRHS(updated.target - g.target - linking.constant)
+        self.goals[name] = updated
 
     # ----------------------------------------------------------------------
     # SOLVE: WEIGHTED GOAL PROGRAMMING
@@ -380,6 +831,7 @@ class GLPModel:
         goal_weights: Optional[Dict[str, Tuple[float, float]]] = None,
         cost_expr: Optional[pulp.LpAffineExpression] = None,
         cost_weight: float = 0.0,
+        solver: Optional[pulp.LpSolver] = None,
     ) -> Dict[str, Any]:
         """
         Solve the model using Weighted Goal Programming (WGP).
@@ -397,6 +849,9 @@ class GLPModel:
             Linear expression representing cost or another primary objective.
         cost_weight : float, optional
             Weight applied to the cost expression.
+        solver : pulp.LpSolver, optional
+            Solver to use. Defaults to HiGHS when ``highspy`` is installed,
+            otherwise CBC.
 
         Returns
         -------
@@ -408,45 +863,167 @@ class GLPModel:
             - objective: final objective value
         """
 
-        terms = []
+        objective = self._build_objective(goal_weights, cost_expr, cost_weight)
 
-        if cost_expr is not None and cost_weight != 0:
-            terms.append(cost_weight * cost_expr)
+        if not objective:
+            raise RuntimeError("No objective terms provided")
+
+        self.problem.setObjective(objective)
+
+        if solver is None:
+            solver = _default_solver()
+        self.problem.solve(solver)
 
+        result = self._collect_results()
+        self._release_solver_model()
+        return result
+
+    # ----------------------------------------------------------------------
+    # SOLVE: LEXICOGRAPHIC (PREEMPTIVE) GOAL PROGRAMMING
+    # ----------------------------------------------------------------------
+    def solve_lexicographic(
+        self,
+        tolerance: float = 1e-6,
+        solver: Optional[pulp.LpSolver] = None,
+    ) -> Dict[str, Any]:
+        """
+        Solve the model using Lexicographic (preemptive) Goal Programming.
+
+        Goals are grouped by ``priority`` (lower numbers first). For each
+        priority level k in turn, the weighted deviations of that level:
+            z_k = sum(w_i * (n_i + p_i)) over goals with priority k
+
+        are minimized, and the constraint:
+            z_k <= z_k* + tolerance
+
+        is added so that lower-priority levels cannot worsen it. Each stage
+        is a small LP, and the final solution is Pareto-efficient with
+        respect to the goals, which a single weighted objective does not
+        guarantee.
+
+        The stage constraints are removed before returning, so the model
+        can be re-solved afterwards with either method.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            Absolute slack allowed on each level's optimum when it is
+            fixed for the following levels.
+        solver : pulp.LpSolver, optional
+            Solver to use for every stage. Defaults to HiGHS when
+            ``highspy`` is installed, otherwise CBC.
+
+        Returns
+        -------
+        dict
+            Same keys as :meth:`solve_weighted` (``objective`` is that of
+            the last stage solved), plus:
+            - objectives: optimal z_k for each priority level solved
+
+            If a stage is not solved to optimality, the remaining levels
+            are skipped and ``status`` reports that stage's status.
+
+        Raises
+        ------
+        RuntimeError
+            If the model has no goals.
+        """
+
+        if not self.goals:
+            raise RuntimeError("No goals defined")
+
+        if solver is None:
+            solver = _default_solver()
+
+        levels: Dict[int, List[str]] = {}
         for gname, g in self.goals.items():
-            n, p = self.dev_vars[gname]
+            levels.setdefault(g.priority, []).append(gname)
 
-            if goal_weights and gname in goal_weights:
-                w_minus, w_plus = goal_weights[gname]
-            else:
-                w_minus = g.weight
-                w_plus = g.weight
+        level_objs: Dict[int, float] = {}
+        stage_names: List[str] = []
 
-            terms.append(w_minus * n)
-            terms.append(w_plus * p)
+        try:
+            for priority in sorted(levels):
+                stage = self._build_stage_objective(levels[priority])
+                self.problem.setObjective(stage)
+                self.problem.solve(solver)
 
-        if not terms:
-            raise RuntimeError("No objective terms provided")
+                if self.problem.status != pulp.LpStatusOptimal:
+                    break
 
-        self.problem += pulp.lpSum(terms)
+                achieved = float(stage.value())
+                level_objs[priority] = achieved
 
-        solver = pulp.PULP_CBC_CMD(msg=False)
-        self.problem.solve(solver)
+                name = f"lex_priority_{priority}"
+                self.problem.addConstraint(stage <= achieved + tolerance, name=name)
+                stage_names.append(name)
 
-        status = pulp.LpStatus[self.problem.status]
+            result = self._collect_results()
+        finally:
+            rows = _constraint_rows(self.problem)
+            for name in stage_names:
+                rows.pop(name)
+            self._release_solver_model()
 
-        var_vals = {
-            name: (None if v.value() is None else float(v.value()))
-            for name, v in self.variables.items()
-        }
+        result["objectives"] = level_objs
+        return result
+
+    # ----------------------------------------------------------------------
+    def _build_stage_objective(
+        self, goal_names: Iterable[str]
+    ) -> pulp.LpAffineExpression:
+        """
+        Build the objective of one lexicographic stage.
+
+        Subclasses extend this to add further penalty terms that must be
+        minimized at every priority level.
+        """
+
+        objective = pulp.LpAffineExpression()
+
+        for gname in goal_names:
+            n, p = self.dev_vars[gname]
+            w = self.goals[gname].weight
+            objective.addterm(n, w)
+            objective.addterm(p, w)
+
+        return objective
+
+    # ----------------------------------------------------------------------
+    def _release_solver_model(self) -> None:
+        """
+        Drop the solver's in-memory model from the PuLP problem.
+
+        HiGHS leaves its ``highspy.Highs`` instance on the problem after a
+        solve. That object cannot be pickled or deep-copied, which would make
+        the whole GLPModel unusable with multiprocessing after a solve.
+        """
+        self.problem.solverModel = None
+
+    # ----------------------------------------------------------------------
+    def _collect_results(self) -> Dict[str, Any]:
+        """
+        Gather status, variable values, deviations and objective value
+        from the last solve.
+        """
 
-        dev_vals = {
-            gname: (
-                float(self.dev_vars[gname][0].value()),
-                float(self.dev_vars[gname][1].value()),
+        status = _LP_STATUS[self.problem.status]
+
+        # Read ``varValue`` directly: the solver has already stored it, so
+        # there is no need to go through ``LpVariable.value()`` per variable.
+        var_vals: Dict[str, Optional[float]] = {}
+        for name, v in self.variables.items():
+            val = v.varValue
+            var_vals[name] = None if val is None else float(val)
+
+        dev_vals = {}
+        for gname in self.goals:
+            n_val = self.dev_vars[gname][0].varValue
+            p_val = self.dev_vars[gname][1].varValue
+            dev_vals[gname] = (
+                None if n_val is None else float(n_val),
+                None if p_val is None else float(p_val),
             )
-            for gname in self.goals
-        }
 
         obj = None
         try:
@@ -461,6 +1038,44 @@ class GLPModel:
             "objective": obj,
         }
 
+    # ----------------------------------------------------------------------
+    def _build_objective(
+        self,
+        goal_weights: Optional[Dict[str, Tuple[float, float]]],
+        cost_expr: Optional[pulp.LpAffineExpression],
+        cost_weight: float,
+    ) -> pulp.LpAffineExpression:
+        """
+        Build the WGP objective as a single expression.
+
+        Coefficients are written into one ``LpAffineExpression`` rather
+        than summing scaled sub-expressions, so the cost expression is
+        walked once and no intermediate copies are made.
+        Subclasses extend this to add further penalty terms (e.g. for
+        elastic constraints) without re-implementing the solve.
+        """
+
+        # Start from the stored default deviation weights (one dict copy)
+        # and only overwrite the goals whose weights are overridden.
+        objective = pulp.LpAffineExpression(self._dev_weights)
+
+        if goal_weights:
+            for gname, (w_minus, w_plus) in goal_weights.items():
+                if gname in self.dev_vars:
+                    n, p = self.dev_vars[gname]
+                    objective[n] = w_minus
+                    objective[p] = w_plus
+
+        if cost_expr is not None and cost_weight != 0:
+            cost = cost_expr
+            if not isinstance(cost, pulp.LpAffineExpression):
+                cost = pulp.LpAffineExpression(cost)
+            for var, coef in cost.items():
+                objective.addterm(var, cost_weight * coef)
+            objective.constant = cost_weight * cost.constant
+
+        return objective
+
     # ----------------------------------------------------------------------
     def __repr__(self) -> str:
         """
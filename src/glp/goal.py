@@ -1,10 +1,14 @@
+import sys
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Dict
 
 from glp.enums import GoalSense
 
+# ``slots`` is only accepted by dataclass() from Python 3.10 onwards.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Goal:
     """
     Represents a goal-programming objective component.
@@ -21,8 +25,11 @@ class Goal:
             indicate higher priority in preemptive goal programming.
 
     Notes:
+        - Instances are immutable; use dataclasses.replace() to derive a
+          modified goal.
         - This class validates weight non-negativity, priority type/range,
-          and the sense enum in __post_init__.
+          and the sense enum in __post_init__ (type checks in debug mode only).
+        - 'target' is coerced to float once at construction.
         - Interpretation of 'sense':
             * ATTAIN: penalize both under- and over-target deviations.
             * MINIMIZE_UNDER: prefer value <= target; penalize over-target deviations.
@@ -41,16 +48,28 @@ class Goal:
         Validate field values after initialization.
 
         Ensures that:
+        - 'target' is numeric; it is stored as a float.
         - 'weight' is non-negative.
         - 'priority' is an integer >= 1.
         - 'sense' is an instance of GoalSense.
 
+        The type checks only run in debug mode (they are stripped under
+        ``python -O``); the range checks always run.
+
         Raises:
             ValueError: If any validation fails.
         """
+        if __debug__:
+            if type(self.priority) is not int:
+                raise ValueError("priority must be integer >= 1")
+            if not isinstance(self.sense, GoalSense):
+                raise ValueError("sense must be GoalSense enum")
+        try:
+            # Frozen dataclass: bypass __setattr__ to store the coerced value.
+            object.__setattr__(self, "target", float(self.target))
+        except (TypeError, ValueError):
+            raise ValueError("Goal.target must be numeric") from None
         if self.weight < 0:
             raise ValueError("Goal.weight cannot be negative.")
-        if not isinstance(self.priority, int) or self.priority < 1:
+        if self.priority < 1:
             raise ValueError("priority must be integer >= 1")
-        if not isinstance(self.sense, GoalSense):
-            raise ValueError("sense must be GoalSense enum")
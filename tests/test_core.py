@@ -1,5 +1,9 @@
+import copy
+import dataclasses
 import os
+import pickle
 import sys
+from typing import Any, Dict
 
 import pulp
 import pytest
@@ -8,7 +12,9 @@ import pytest
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
 from glp.constraint import Constraint
-from glp.core import GLPModel
+from glp.core import GLPModel, _sanitize_name
+from glp.core_with_bigM import ElasticConstraint
+from glp.core_with_bigM import GLPModel as ElasticGLPModel
 from glp.enums import ConstraintSense, GoalSense
 from glp.goal import Goal
 
@@ -30,6 +36,36 @@ def test_goal_dataclass_defaults_and_validation() -> None:
     with pytest.raises(ValueError):
         Goal(name="bad", expression=1 * x, target=10.0, weight=-1.0)
 
+    # priority must be >= 1
+    with pytest.raises(ValueError):
+        Goal(name="bad", expression=1 * x, target=10.0, priority=0)
+
+    # targets are coerced to float once; non-numeric targets are rejected
+    assert type(Goal(name="int_target", expression=1 * x, target=3).target) is float
+    with pytest.raises(ValueError):
+        Goal(name="bad", expression=1 * x, target=None)  # type: ignore[arg-type]
+
+    # goals are immutable
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        g.target = 60.0  # type: ignore[misc]
+
+
+@pytest.mark.skipif(not __debug__, reason="type checks are stripped by python -O")
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"sense": "attain"},
+        {"sense": ["attain"]},
+        {"sense": {}},
+        {"priority": True},
+    ],
+)
+def test_goal_type_checks(kwargs: Dict[str, Any]) -> None:
+    """Check sense must be a GoalSense and priority a plain int (debug mode)."""
+    x = pulp.LpVariable("x", lowBound=0)
+    with pytest.raises(ValueError):
+        Goal(name="bad", expression=1 * x, target=10.0, **kwargs)
+
 
 def test_constraint_dataclass_and_validation() -> None:
     """Check Constraint dataclass creation."""
@@ -38,6 +74,53 @@ def test_constraint_dataclass_and_validation() -> None:
     assert c.name == "cap"
     assert c.sense == ConstraintSense.LE
     assert c.rhs == 100
+    assert type(c.rhs) is float
+    with pytest.raises(ValueError):
+        Constraint(name="bad", expression=x, sense=ConstraintSense.LE, rhs=None)  # type: ignore[arg-type]
+
+    # sense must be a ConstraintSense member (checked in debug mode only)
+    if __debug__:
+        for sense in ("<=", ["<="], {}):
+            with pytest.raises(ValueError):
+                Constraint(name="bad", expression=x, sense=sense, rhs=1)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("protein", "protein"),
+        ("  cap total  ", "cap_total"),
+        ("a – b", "a_b"),
+        ("a--b", "a_b"),
+        ("a__b", "a_b"),
+        ("a___b", "a_b"),
+        ("_lead", "_lead"),
+        ("trail_", "trail_"),
+        ("__both__", "_both_"),
+        ("süß-wasser", "süß_wasser"),
+    ],
+)
+def test_sanitize_name(raw: str, expected: str) -> None:
+    """Check names are rewritten to PuLP-safe identifiers."""
+    assert _sanitize_name(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["", "   ", "\t\n"])
+def test_sanitize_name_rejects_blank(raw: str) -> None:
+    """Check blank names cannot be sanitized."""
+    with pytest.raises(ValueError):
+        _sanitize_name(raw)
+
+
+def test_core_reexports_single_definitions() -> None:
+    """Check glp.core re-exports the one definition of each building block."""
+    import glp.core
+    import glp.enums
+
+    assert glp.core.GoalSense is glp.enums.GoalSense
+    assert glp.core.ConstraintSense is glp.enums.ConstraintSense
+    assert glp.core.Goal is Goal
+    assert glp.core.Constraint is Constraint
 
 
 def test_glpmodel_add_variable_and_constraint_and_goal() -> None:
@@ -49,6 +132,8 @@ def test_glpmodel_add_variable_and_constraint_and_goal() -> None:
     assert "rice" in model.variables
     assert "lentils" in model.variables
     assert isinstance(v1, pulp.LpVariable)
+    assert model.add_variable("servings", cat="int").cat == pulp.LpInteger
+    assert model.add_variable("use_dal", cat="Binary").upBound == 1
 
     # add constraint: 10*rice + 5*lentils <= 100
     expr = 10 * v1 + 5 * v2
@@ -58,6 +143,11 @@ def test_glpmodel_add_variable_and_constraint_and_goal() -> None:
     model.add_constraint(c)
     assert any("cap_total" in name for name in model.problem.constraints.keys())
 
+    # strict inequalities cannot be expressed in an LP
+    strict = Constraint(name="strict", expression=expr, sense=ConstraintSense.LT, rhs=1)
+    with pytest.raises(ValueError):
+        model.add_constraint(strict)
+
     # add goal: protein = 50 (where protein = 2*rice + 10*lentils)
     protein_expr = 2 * v1 + 10 * v2
     goal = Goal(name="protein_goal", expression=protein_expr, target=50.0)
@@ -69,6 +159,49 @@ def test_glpmodel_add_variable_and_constraint_and_goal() -> None:
     )
 
 
+def test_problem_built_on_first_access_with_current_sense() -> None:
+    """Check the PuLP problem picks up a sense changed after construction."""
+    model = GLPModel("lazy")
+    x = model.add_variable("x", low_bound=0, up_bound=10)
+    model.add_goal(Goal(name="g", expression=x, target=4.0))
+    assert model.minimize
+
+    model.minimize = False
+    assert model.problem.sense == pulp.LpMaximize
+    assert "goal_link_g" in model.problem.constraints.keys()
+
+    model.minimize = True
+    assert model.problem.sense == pulp.LpMinimize
+
+
+def test_held_problem_sees_rows_added_later() -> None:
+    """Check rows reach a held problem reference and in-place PuLP edits."""
+    model = GLPModel("held")
+    x = model.add_variable("x", low_bound=0, up_bound=10)
+    model.add_goal(Goal(name="g", expression=x, target=10.0))
+
+    prob = model.problem
+    model.add_constraint(
+        Constraint(name="cap", expression=x, sense=ConstraintSense.LE, rhs=3)
+    )
+    model.problem += x >= 1, "floor"
+
+    assert {"goal_link_g", "cap", "floor"} <= set(prob.constraints.keys())
+    assert model.problem is prob
+
+
+def test_add_constraint_rejects_non_linear_row() -> None:
+    """Check a constraint that evaluates to a bool is rejected up front."""
+    model = GLPModel("bool_row")
+    model.add_variable("x", low_bound=0)
+    with pytest.raises(TypeError):
+        model.add_constraint(
+            Constraint(name="c", expression=5, sense=ConstraintSense.LE, rhs=3)
+        )
+    assert model.constraints == {}
+    assert len(model.problem.constraints) == 0
+
+
 def test_duplicate_goal_name_raises() -> None:
     """Check duplicate goal names raise an error."""
     model = GLPModel("dup_test")
@@ -80,6 +213,175 @@ def test_duplicate_goal_name_raises() -> None:
         model.add_goal(g2)
 
 
+def test_str_subclass_names_are_accepted() -> None:
+    """Check names may be str subclasses (e.g. numpy.str_), which can't be interned."""
+
+    class Name(str):
+        pass
+
+    model = GLPModel("str_subclass")
+    model.add_variables([Name("rice"), Name("wheat")], group="cereals")
+    x = model.variables["rice"]
+    model.add_goal(Goal(name=Name("g"), expression=x, target=1.0))
+    model.add_constraint(
+        Constraint(name=Name("c"), expression=x, sense=ConstraintSense.LE, rhs=2)
+    )
+    assert set(model.variables) >= {"rice", "wheat"}
+    assert "g" in model.goals and "c" in model.constraints
+
+
+def test_add_to_group_skips_duplicates() -> None:
+    """Check group membership keeps insertion order and ignores repeats."""
+    model = GLPModel("group_test")
+    model.add_variables(["rice", "wheat"], group="cereals")
+    model.add_variable("millet")
+    model.add_to_group("cereals", ["wheat", "millet", "rice", "millet"])
+    assert model.variable_groups["cereals"] == ["rice", "wheat", "millet"]
+
+    with pytest.raises(KeyError):
+        model.add_to_group("cereals", ["unknown"])
+
+
+def test_add_group_bounds_limits_group_total() -> None:
+    """Check collective group bounds are enforced and can be replaced."""
+    model = GLPModel("group_bounds")
+    model.add_variables(["rice", "wheat"], group="cereals")
+    total = model.variables["rice"] + model.variables["wheat"]
+    model.add_goal(Goal(name="cereal_total", expression=total, target=10.0))
+
+    model.add_group_bounds("cereals", lower=2.0, upper=6.0)
+    res = model.solve_weighted()
+    assert pytest.approx(res["deviations"]["cereal_total"][0], rel=1e-6) == 4.0
+
+    model.add_group_bounds("cereals", upper=8.0)
+    res = model.solve_weighted()
+    assert pytest.approx(res["deviations"]["cereal_total"][0], rel=1e-6) == 2.0
+
+
+def test_add_group_bounds_does_not_replace_other_rows() -> None:
+    """Check group bounds cannot overwrite a row the method did not create."""
+    model = GLPModel("bound_clash")
+    model.add_variables(["x"], group="g")
+    x = model.variables["x"]
+    model.add_constraint(
+        Constraint(name="g_LL", expression=x, sense=ConstraintSense.LE, rhs=3)
+    )
+
+    with pytest.raises(pulp.PulpError):
+        model.add_group_bounds("g", lower=1.0)
+    model.flush()  # create the problem, then try again
+    with pytest.raises(pulp.PulpError):
+        model.add_group_bounds("g", lower=1.0, upper=2.0)
+
+    row = model.problem.constraints["g_LL"]
+    assert row.sense == pulp.LpConstraintLE
+    assert "g_UL" not in model.problem.constraints.keys()
+
+
+def test_add_group_bounds_sanitizes_row_names() -> None:
+    """Check bound rows use sanitized names, so clashes are still detected."""
+    model = GLPModel("bound_names")
+    model.add_variables(["rice", "wheat"], group="Cereal Grains")
+    x = model.variables["rice"]
+
+    model.add_group_bounds("Cereal Grains", upper=6.0)
+    model.add_group_bounds("Cereal Grains", upper=8.0)  # replaces its own row
+    assert model.problem.constraints["Cereal_Grains_UL"].name == "Cereal_Grains_UL"
+
+    with pytest.raises(pulp.PulpError):
+        model.add_constraint(
+            Constraint(
+                name="Cereal Grains UL",
+                expression=x,
+                sense=ConstraintSense.LE,
+                rhs=1,
+            )
+        )
+    assert "Cereal Grains UL" not in model.constraints
+
+
+def test_add_group_ratios_emits_k_minus_one_rows() -> None:
+    """Check group ratios are enforced with one equality per extra member."""
+    model = GLPModel("ratio_test")
+    model.add_variables(["rice", "wheat"], group="cereals")
+    model.add_group_ratios("cereals", {"rice": 0.8, "wheat": 0.2})
+    ratio_rows = [n for n in model.problem.constraints.keys() if "RATIO" in n]
+    assert ratio_rows == ["cereals_RATIO_wheat"]
+
+    total = model.variables["rice"] + model.variables["wheat"]
+    model.add_goal(Goal(name="cereal_total", expression=total, target=10.0))
+    res = model.solve_weighted()
+    assert pytest.approx(res["variables"]["rice"], rel=1e-6) == 8.0
+    assert pytest.approx(res["variables"]["wheat"], rel=1e-6) == 2.0
+
+    with pytest.raises(KeyError):
+        model.add_group_ratios("cereals", {"rice": 1.0, "dal": 1.0})
+    with pytest.raises(ValueError):
+        model.add_group_ratios("cereals", {"rice": 1.0, "wheat": 0.0})
+
+
+def test_add_goals_is_all_or_nothing() -> None:
+    """Check bulk goal addition and that duplicates leave the model unchanged."""
+    model = GLPModel("bulk_goals")
+    v = model.add_variable("a", low_bound=0)
+    devs = model.add_goals(
+        Goal(name=f"g{i}", expression=(i + 1) * v, target=10.0) for i in range(3)
+    )
+    assert list(devs) == ["g0", "g1", "g2"]
+    assert devs["g1"] == model.dev_vars["g1"]
+
+    with pytest.raises(ValueError):
+        model.add_goals(
+            [
+                Goal(name="h", expression=1 * v, target=1.0),
+                Goal(name="h", expression=2 * v, target=2.0),
+            ]
+        )
+    assert "h" not in model.goals
+
+
+def test_add_goal_rejects_non_linear_expression() -> None:
+    """Check a bad goal expression raises TypeError and adds nothing."""
+    model = GLPModel("bad_expr")
+    x = model.add_variable("x", low_bound=0)
+    with pytest.raises(TypeError):
+        model.add_goal(Goal(name="g", expression=[1, 2], target=1.0))
+    with pytest.raises(TypeError):
+        model.add_goal(Goal(name="g", expression=x >= 3, target=5.0))
+    assert model.goals == {}
+    assert len(model.problem.constraints) == 0
+
+
+def test_add_constraints_validates_before_adding() -> None:
+    """Check bulk constraint addition is all-or-nothing."""
+    model = GLPModel("bulk_constraints")
+    x = model.add_variable("x", low_bound=0)
+    model.add_constraints(
+        Constraint(name=f"c{i}", expression=x, sense=ConstraintSense.LE, rhs=i)
+        for i in range(1, 4)
+    )
+    assert list(model.constraints) == ["c1", "c2", "c3"]
+
+    batch = [
+        Constraint(name="ok", expression=x, sense=ConstraintSense.GE, rhs=0),
+        Constraint(name="bad", expression=x, sense=ConstraintSense.GT, rhs=0),
+    ]
+    with pytest.raises(ValueError):
+        model.add_constraints(batch)
+    assert "ok" not in model.constraints
+    assert not any(n == "ok" for n in model.problem.constraints.keys())
+
+    # names that sanitize to the same PuLP row are rejected before queueing
+    clash = [
+        Constraint(name="cap a", expression=x, sense=ConstraintSense.LE, rhs=5),
+        Constraint(name="cap-a", expression=x, sense=ConstraintSense.LE, rhs=6),
+    ]
+    with pytest.raises(pulp.PulpError):
+        model.add_constraints(clash)
+    assert "cap a" not in model.constraints
+    assert "cap_a" not in model.problem.constraints.keys()
+
+
 # ----------------------------
 # Weighted Goal Programming (WGP) Test
 # ----------------------------
@@ -132,5 +434,116 @@ def test_simple_wgp_two_goals() -> None:
     assert pytest.approx(res["objective"], rel=1e-6) == 0.0
 
 
+def test_solve_weighted_with_cost_term() -> None:
+    """Check the cost expression is scaled into the objective with its constant."""
+    model = GLPModel(name="test_cost")
+    x = model.add_variable("x", low_bound=0.0)
+    y = model.add_variable("y", low_bound=0.0)
+    model.add_goal(Goal(name="total", expression=x + y, target=10.0, weight=100.0))
+
+    res = model.solve_weighted(cost_expr=2 * x + 3 * y + 1, cost_weight=0.5)
+    assert res["status"] == "Optimal"
+    assert pytest.approx(res["variables"]["x"], rel=1e-6) == 10.0
+    assert pytest.approx(res["variables"]["y"], abs=1e-9) == 0.0
+    assert pytest.approx(res["objective"], rel=1e-6) == 10.5
+
+
+def test_solve_weighted_accepts_explicit_solver() -> None:
+    """Check a caller-supplied PuLP solver is used instead of the default."""
+    model = GLPModel(name="test_solver")
+    x = model.add_variable("x", low_bound=0.0)
+    model.add_goal(Goal(name="g", expression=x, target=4.0))
+
+    res = model.solve_weighted(solver=pulp.PULP_CBC_CMD(msg=False))
+    assert res["status"] == "Optimal"
+    assert pytest.approx(res["variables"]["x"], rel=1e-6) == 4.0
+    assert isinstance(model.problem.solver, pulp.PULP_CBC_CMD)
+
+
+def test_solved_model_stays_picklable() -> None:
+    """Check a solved model can be pickled and deep-copied (multiprocessing)."""
+    model = GLPModel("picklable")
+    x = model.add_variable("x", low_bound=0)
+    model.add_goal(Goal(name="g", expression=x, target=3.0))
+    model.solve_weighted()
+    pickle.dumps(model)
+    copy.deepcopy(model)
+
+    model.solve_lexicographic()
+    pickle.dumps(model)
+
+
+def test_set_goal_target_resolves_with_new_rhs() -> None:
+    """Check goal targets can be swept without rebuilding the model."""
+    model = GLPModel(name="test_sweep")
+    x = model.add_variable("x", low_bound=0.0)
+    model.add_goal(Goal(name="g", expression=x + 2, target=5.0))
+
+    res = model.solve_weighted()
+    assert pytest.approx(res["variables"]["x"], rel=1e-6) == 3.0
+
+    model.set_goal_target("g", 9.0)
+    assert model.goals["g"].target == 9.0
+    res = model.solve_weighted()
+    assert pytest.approx(res["variables"]["x"], rel=1e-6) == 7.0
+    assert pytest.approx(res["objective"], abs=1e-9) == 0.0
+
+    with pytest.raises(KeyError):
+        model.set_goal_target("missing", 1.0)
+
+
+def test_solve_lexicographic_respects_priorities() -> None:
+    """
+    Conflicting goals on different priority levels:
+        g_high (priority 1): x = 10
+        g_low  (priority 2): x = 4, with a much larger weight
+    WGP follows the heavier goal, while the lexicographic solve must meet
+    the priority-1 goal first and only then minimize the priority-2 one.
+    """
+    model = GLPModel(name="test_lex")
+    x = model.add_variable("x", low_bound=0.0)
+    model.add_goal(Goal(name="g_high", expression=x, target=10.0, priority=1))
+    model.add_goal(
+        Goal(name="g_low", expression=x, target=4.0, weight=100.0, priority=2)
+    )
+
+    res = model.solve_lexicographic()
+    assert res["status"] == "Optimal"
+    assert pytest.approx(res["variables"]["x"], rel=1e-6) == 10.0
+    assert pytest.approx(res["objectives"][1], abs=1e-9) == 0.0
+    assert pytest.approx(res["objectives"][2], rel=1e-6) == 600.0
+    assert pytest.approx(res["deviations"]["g_low"][1], rel=1e-6) == 6.0
+
+    # stage constraints are removed, so a weighted solve is unaffected
+    assert not any("lex_priority" in n for n in model.problem.constraints.keys())
+    res = model.solve_weighted()
+    assert pytest.approx(res["variables"]["x"], rel=1e-6) == 4.0
+
+
+def test_elastic_constraint_violation_is_penalized() -> None:
+    """Check the Big-M model relaxes an elastic constraint only as needed."""
+    model = ElasticGLPModel(name="test_elastic")
+    x = model.add_variable("x", low_bound=0.0)
+    model.add_goal(Goal(name="g", expression=x, target=10.0, weight=1.0))
+    v = model.add_elastic_constraint(
+        ElasticConstraint(
+            name="cap", expression=x, sense=ConstraintSense.LE, rhs=4.0, penalty=0.5
+        )
+    )
+
+    res = model.solve_weighted()
+    assert res["status"] == "Optimal"
+    # violating the cap (penalty 0.5) is cheaper than under-achieving g (1.0)
+    assert pytest.approx(res["variables"]["x"], rel=1e-6) == 10.0
+    assert pytest.approx(v.value(), rel=1e-6) == 6.0
+    assert pytest.approx(res["objective"], rel=1e-6) == 3.0
+
+    # unsupported senses are rejected before any violation variable exists
+    bad = ElasticConstraint(name="bad", expression=x, sense=ConstraintSense.GT, rhs=1.0)
+    with pytest.raises(ValueError):
+        model.add_elastic_constraint(bad)
+    assert "v_bad" not in model.variables
+
+
 # if __name__ == "__main__":
 #     unittest.main()